@@ -0,0 +1,21 @@
+"""Shared fixtures for the profile test suite."""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def update_profile_mod():
+    """Import update_profile exactly once for the whole session.
+
+    Module initialization is paid a single time; per-test configuration
+    goes through monkeypatched module globals and environment variables
+    that update_profile reads inside main(), never through reloads.
+    """
+    sys.path.insert(0, str(REPO_ROOT))
+    return importlib.import_module("update_profile")
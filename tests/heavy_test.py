@@ -0,0 +1,143 @@
+"""Exercises the heavy commit/LOC scan, its pagination, and its cache."""
+
+import functools
+import json
+
+USER_ID = "MDQ6VXNlcjE="
+
+REPO_LIST_JSON = {
+    "data": {
+        "user": {
+            "repositories": {
+                "edges": [
+                    {
+                        "node": {
+                            "nameWithOwner": "HimuCodes/demo",
+                            "isArchived": False,
+                            "isEmpty": False,
+                            "isFork": False,
+                            "pushedAt": "2024-06-01T00:00:00Z",
+                            "defaultBranchRef": {
+                                "target": {
+                                    "oid": "oid-demo-1",
+                                    "history": {"totalCount": 4},
+                                }
+                            },
+                        }
+                    }
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    }
+}
+CONTRIB_JSON = {
+    "data": {
+        "user": {
+            "contributionsCollection": {
+                "totalCommitContributions": 3,
+                "restrictedContributionsCount": 0,
+            }
+        }
+    }
+}
+
+
+def _commit(additions, deletions):
+    # The history query filters by author server-side, so edges carry
+    # only the LOC counters.
+    return {"node": {"additions": additions, "deletions": deletions}}
+
+
+HISTORY_PAGE1_JSON = {
+    "data": {
+        "r0": {
+            "defaultBranchRef": {
+                "target": {
+                    "history": {
+                        "edges": [_commit(100, 20)],
+                        "pageInfo": {"hasNextPage": True, "endCursor": "cursor-1"},
+                    }
+                }
+            }
+        }
+    }
+}
+HISTORY_PAGE2_JSON = {
+    "data": {
+        "r0": {
+            "defaultBranchRef": {
+                "target": {
+                    "history": {
+                        "edges": [_commit(150, 30), _commit(50, 10)],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    }
+                }
+            }
+        }
+    }
+}
+
+CALLS = {"history": 0}
+
+
+class FakeResp:
+    def __init__(self, payload):
+        self.payload = payload
+        self.status_code = 200
+        self.headers = {}
+
+    @functools.cached_property
+    def content(self):
+        # gql decodes .content itself; serialize lazily and only once.
+        return json.dumps(self.payload).encode()
+
+
+# Canned responses are immutable, so serialize each payload exactly once
+# instead of rebuilding a FakeResp (and re-running json.dumps) per call.
+_RESP_REPO_LIST = FakeResp(REPO_LIST_JSON)
+_RESP_CONTRIB = FakeResp(CONTRIB_JSON)
+_RESP_HISTORY_PAGE1 = FakeResp(HISTORY_PAGE1_JSON)
+_RESP_HISTORY_PAGE2 = FakeResp(HISTORY_PAGE2_JSON)
+
+
+def _serve_history(variables):
+    CALLS["history"] += 1
+    return _RESP_HISTORY_PAGE2 if variables.get("c0") else _RESP_HISTORY_PAGE1
+
+
+# One unique discriminating token per query shape, checked in order.
+_DISPATCH = (
+    ("history(first: 100", _serve_history),
+    ("contributionsCollection", lambda variables: _RESP_CONTRIB),
+    ("ORGANIZATION_MEMBER", lambda variables: _RESP_REPO_LIST),
+)
+
+
+def fake_post(url, json=None, headers=None, **kwargs):
+    q = json["query"]
+    for token, serve in _DISPATCH:
+        if token in q:
+            return serve(json["variables"])
+    raise AssertionError("unexpected query: " + q[:120])
+
+
+def test_heavy_scan_and_cache(tmp_path, monkeypatch, update_profile_mod):
+    CALLS.update(history=0)
+    # Only SESSION.post is faked, so force the sync fallback: with
+    # aiohttp importable the scan would otherwise hit the real API.
+    monkeypatch.setattr(update_profile_mod, "aiohttp", None)
+    monkeypatch.setattr(update_profile_mod.SESSION, "post", fake_post)
+    monkeypatch.setattr(update_profile_mod, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.delenv("FORCE_CACHE", raising=False)
+
+    commits, loc_add, loc_del = update_profile_mod.heavy_stats(USER_ID)
+    assert (commits, loc_add, loc_del) == (3, 300, 60)
+    history_calls = CALLS["history"]
+    assert history_calls == 2  # one repo, two pages
+
+    # Second run: the contribution count is unchanged, so the cached sums
+    # come back without any scan traffic.
+    commits, loc_add, loc_del = update_profile_mod.heavy_stats(USER_ID)
+    assert (commits, loc_add, loc_del) == (3, 300, 60)
+    assert CALLS["history"] == history_calls
@@ -0,0 +1,187 @@
+"""End-to-end run of update_profile.main() with every GraphQL call faked."""
+
+import functools
+import json
+import shutil
+from pathlib import Path
+
+from lxml import etree
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+USER_JSON = {
+    "data": {"user": {"id": "MDQ6VXNlcjE=", "createdAt": "2020-05-01T00:00:00Z"}}
+}
+FOLLOWERS_JSON = {"data": {"user": {"followers": {"totalCount": 42}}}}
+CONTRIB_JSON = {
+    "data": {
+        "user": {
+            "contributionsCollection": {
+                "totalCommitContributions": 4,
+                "restrictedContributionsCount": 0,
+            }
+        }
+    }
+}
+STARS_JSON = {
+    "data": {
+        "user": {
+            "repositories": {
+                "totalCount": 2,
+                "edges": [
+                    {"node": {"stargazers": {"totalCount": 3}}},
+                    {"node": {"stargazers": {"totalCount": 5}}},
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    }
+}
+REPO_LIST_JSON = {
+    "data": {
+        "user": {
+            "repositories": {
+                "edges": [
+                    {
+                        "node": {
+                            "nameWithOwner": "HimuCodes/HimuCodes",
+                            "isArchived": False,
+                            "isEmpty": False,
+                            "isFork": False,
+                            "pushedAt": "2024-06-01T00:00:00Z",
+                            "defaultBranchRef": {
+                                "target": {
+                                    "oid": "oid-profile",
+                                    "history": {"totalCount": 2},
+                                }
+                            },
+                        }
+                    },
+                    {
+                        "node": {
+                            "nameWithOwner": "friend/shared-project",
+                            "isArchived": False,
+                            "isEmpty": False,
+                            "isFork": False,
+                            "pushedAt": "2024-06-01T00:00:00Z",
+                            "defaultBranchRef": {
+                                "target": {
+                                    "oid": "oid-shared",
+                                    "history": {"totalCount": 2},
+                                }
+                            },
+                        }
+                    },
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    }
+}
+_BRANCH_HISTORY = {
+    "defaultBranchRef": {
+        "target": {
+            "history": {
+                "edges": [
+                    {
+                        "node": {
+                            "author": {"user": {"login": "HimuCodes"}},
+                            "additions": 120,
+                            "deletions": 20,
+                        }
+                    },
+                    {
+                        "node": {
+                            "author": {"user": {"login": "HimuCodes"}},
+                            "additions": 30,
+                            "deletions": 10,
+                        }
+                    },
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        }
+    }
+}
+HISTORY_JSON = {"data": {"r0": _BRANCH_HISTORY, "r1": _BRANCH_HISTORY}}
+
+
+class FakeResp:
+    def __init__(self, payload):
+        self.payload = payload
+        self.status_code = 200
+        self.headers = {}
+
+    @functools.cached_property
+    def content(self):
+        # gql decodes .content itself; serialize lazily and only once.
+        return json.dumps(self.payload).encode()
+
+
+# Canned responses are immutable, so serialize each payload exactly once
+# instead of rebuilding a FakeResp (and re-running json.dumps) per call.
+_RESP_USER = FakeResp(USER_JSON)
+_RESP_FOLLOWERS = FakeResp(FOLLOWERS_JSON)
+_RESP_CONTRIB = FakeResp(CONTRIB_JSON)
+_RESP_STARS = FakeResp(STARS_JSON)
+_RESP_REPO_LIST = FakeResp(REPO_LIST_JSON)
+_RESP_HISTORY = FakeResp(HISTORY_JSON)
+
+
+# One unique discriminating token per query shape, checked in order, so
+# each mocked call does a handful of substring scans instead of the old
+# chain of compound `in` tests.
+_DISPATCH = (
+    ("history(first: 100", _RESP_HISTORY),
+    ("contributionsCollection", _RESP_CONTRIB),
+    ("ownerAffiliations: OWNER)", _RESP_STARS),
+    ("ORGANIZATION_MEMBER", _RESP_REPO_LIST),
+    ("followers", _RESP_FOLLOWERS),
+    ("createdAt", _RESP_USER),
+)
+
+
+def fake_post(url, json=None, headers=None, **kwargs):
+    q = json["query"]
+    for token, resp in _DISPATCH:
+        if token in q:
+            return resp
+    raise AssertionError("unexpected query: " + q[:120])
+
+
+STAT_IDS = [
+    "age_data",
+    "repo_data",
+    "commit_data",
+    "star_data",
+    "follower_data",
+    "loc_data",
+]
+
+
+def test_main_offline(tmp_path, monkeypatch, update_profile_mod):
+    svgs = []
+    for svg in ("dark_mode.svg", "light_mode.svg"):
+        # copyfile stays in the kernel (copy_file_range on Linux) and
+        # skips the decode/re-encode of the read_text/write_text pair.
+        shutil.copyfile(REPO_ROOT / svg, tmp_path / svg)
+        svgs.append(tmp_path / svg)
+    # Only SESSION.post is faked, so force the sync fallback: with
+    # aiohttp importable the heavy scan would otherwise hit the real API.
+    monkeypatch.setattr(update_profile_mod, "aiohttp", None)
+    monkeypatch.setattr(update_profile_mod.SESSION, "post", fake_post)
+    monkeypatch.setattr(update_profile_mod, "SVG_FILES", svgs)
+    monkeypatch.setattr(update_profile_mod, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setenv("DO_HEAVY", "1")
+
+    update_profile_mod.main()
+
+    for svg in svgs:
+        root = etree.fromstring(svg.read_bytes())
+        # One walk collecting ids beats re-compiling and re-running an
+        # XPath full-tree search per stat id.
+        ids = {el.get("id"): el for el in root.iter() if el.get("id")}
+        for stat_id in STAT_IDS:
+            el = ids.get(stat_id)
+            assert el is not None, stat_id
+            assert el.text and el.text.strip() != "--", stat_id
@@ -0,0 +1,940 @@
+#!/usr/bin/env python3
+"""Regenerate the profile stat cards (dark_mode.svg / light_mode.svg).
+
+Pulls account stats from the GitHub GraphQL API, optionally walks every
+reachable repo's default-branch history for commit/LOC totals
+(DO_HEAVY=1), and rewrites the stats block inside both SVG cards.
+Intended to run on a schedule from the profile repo's CI.
+"""
+
+import asyncio
+import base64
+import calendar
+import contextlib
+import datetime
+import email.utils
+import functools
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+
+# aiohttp is optional: with it the heavy scan multiplexes one connection
+# pool; without it the same coroutines run the sync client in worker
+# threads (requests releases the GIL during socket I/O).
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# orjson (C + SIMD) parses the heavy scan's 100-commit pages several
+# times faster than stdlib json; decoding falls back silently without it.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+ROOT = Path(__file__).resolve().parent
+USER_NAME = os.environ.get("USER_NAME", "HimuCodes")
+ACCESS_TOKEN = os.environ.get("ACCESS_TOKEN", "")
+HEADERS = {
+    "authorization": f"token {ACCESS_TOKEN}",
+    "Accept-Encoding": "gzip, deflate",
+}
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# One long-lived session for every GraphQL call: connection keep-alive
+# drops the per-request TCP+TLS handshake (~100 ms each), which adds up
+# to tens of seconds over a heavy scan. Retries stay in gql itself.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+)
+
+SVG_FILES = [ROOT / "dark_mode.svg", ROOT / "light_mode.svg"]
+LOGO_PATH = ROOT / "logo.png"
+CACHE_DIR = ROOT / "cache"
+
+MAX_RETRIES = 5
+RETRY_BACKOFF = 2
+# Bounded per-host concurrency; high enough to hide latency, low enough
+# to stay clear of GitHub's secondary rate limits.
+HEAVY_CONCURRENCY = 16
+
+SVG_NS = "http://www.w3.org/2000/svg"
+CHAR_WIDTH_PX = 8.4
+LINE_HEIGHT_PX = 26
+
+class RateLimiter:
+    """Gate requests on what GitHub's rate-limit signals actually say.
+
+    Every response feeds X-RateLimit-Remaining / X-RateLimit-Reset and
+    any Retry-After back in; when remaining drops below the concurrency
+    width, or a 403/429 names a wait, new requests block until the reset
+    instead of burning retries against a closed window. Queries that
+    request the GraphQL `rateLimit` object feed its remaining/resetAt in
+    the same way.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+    def _delay(self):
+        with self._lock:
+            return self._blocked_until - time.time()
+
+    def wait(self):
+        delay = self._delay()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self._delay()
+
+    async def wait_async(self):
+        delay = self._delay()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._delay()
+
+    def _block_until(self, when):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, when)
+
+    def note_response(self, status, headers):
+        retry_after = headers.get("Retry-After")
+        if status in (403, 429) and retry_after:
+            # Retry-After is either delta-seconds or an HTTP-date; an
+            # unparseable value is ignored rather than killing the run
+            # from inside the retry loop.
+            try:
+                until = time.time() + int(retry_after)
+            except ValueError:
+                try:
+                    until = email.utils.parsedate_to_datetime(
+                        retry_after
+                    ).timestamp()
+                except (TypeError, ValueError):
+                    return
+            self._block_until(until)
+            return
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            if int(remaining) < HEAVY_CONCURRENCY:
+                self._block_until(float(reset))
+
+    def note_graphql(self, rate):
+        if rate and int(rate["remaining"]) < HEAVY_CONCURRENCY:
+            reset_at = datetime.datetime.strptime(
+                rate["resetAt"], "%Y-%m-%dT%H:%M:%SZ"
+            ).replace(tzinfo=datetime.timezone.utc)
+            self._block_until(reset_at.timestamp())
+
+
+RATE_LIMITER = RateLimiter()
+
+# Per-tag TTLs for the on-disk GraphQL response cache. Slow-changing
+# account queries are worth caching across dev runs and CI retries;
+# anything feeding the commit/LOC cache stays at 0 (never cached) so its
+# integrity logic always sees fresh data.
+GQL_CACHE_TTL = {
+    "user_getter": 86400,
+    "followers": 3600,
+    "repos_stars": 1800,
+}
+
+
+def _gql_cache_file(query, variables):
+    key = hashlib.sha256(
+        (query + json.dumps(variables, sort_keys=True) + USER_NAME).encode()
+    ).hexdigest()
+    return CACHE_DIR / "gql" / (key + ".json")
+
+
+def gql(query, variables, tag):
+    """POST one GraphQL document, retrying with exponential backoff.
+
+    Responses for tags listed in GQL_CACHE_TTL are served from a disk
+    cache keyed by query+variables while fresh; FORCE_CACHE=1 skips the
+    read (the fresh response is still written back).
+    """
+    ttl = GQL_CACHE_TTL.get(tag, 0)
+    cache_file = None
+    if ttl:
+        cache_file = _gql_cache_file(query, variables)
+        if os.environ.get("FORCE_CACHE") != "1":
+            try:
+                blob = json.loads(cache_file.read_text())
+                if time.time() - blob["ts"] < ttl:
+                    return blob["data"]
+            except (FileNotFoundError, ValueError, KeyError):
+                pass
+    r = None
+    for attempt in range(MAX_RETRIES):
+        RATE_LIMITER.wait()
+        r = SESSION.post(
+            GRAPHQL_URL, json={"query": query, "variables": variables}
+        )
+        RATE_LIMITER.note_response(r.status_code, r.headers)
+        if r.status_code == 200:
+            data = _loads(r.content)
+            if "errors" not in data:
+                RATE_LIMITER.note_graphql(data["data"].get("rateLimit"))
+                if cache_file is not None:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    cache_file.write_text(
+                        json.dumps({"ts": time.time(), "data": data["data"]})
+                    )
+                return data["data"]
+        time.sleep(RETRY_BACKOFF ** attempt)
+    raise RuntimeError(f"{tag}: request failed after {MAX_RETRIES} attempts")
+
+
+def user_getter(login):
+    """Return the user's node id and account creation timestamp."""
+    query = """
+    query($login: String!) {
+        user(login: $login) { id createdAt }
+    }"""
+    user = gql(query, {"login": login}, "user_getter")["user"]
+    return user["id"], user["createdAt"]
+
+
+def contrib_total(login):
+    """Total authored commit contributions, one cheap GraphQL call.
+
+    Used as the heavy scan's change gate: the number moves whenever the
+    user authors a commit anywhere, so an unchanged value means the
+    cached per-repo sums are still right.
+    """
+    query = """
+    query($login: String!) {
+        user(login: $login) {
+            contributionsCollection {
+                totalCommitContributions restrictedContributionsCount
+            }
+        }
+    }"""
+    cc = gql(query, {"login": login}, "contrib_total")["user"][
+        "contributionsCollection"
+    ]
+    return int(cc["totalCommitContributions"]) + int(
+        cc["restrictedContributionsCount"]
+    )
+
+
+def follower_getter(login):
+    query = """
+    query($login: String!) {
+        user(login: $login) { followers { totalCount } }
+    }"""
+    data = gql(query, {"login": login}, "followers")
+    return int(data["user"]["followers"]["totalCount"])
+
+
+def stars_and_repos(login):
+    """Count owned repos and the stars across them."""
+    query = """
+    query($login: String!, $cursor: String) {
+        user(login: $login) {
+            repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
+                totalCount
+                edges { node { stargazers { totalCount } } }
+                pageInfo { hasNextPage endCursor }
+            }
+        }
+    }"""
+    cursor = None
+    repo_total = stars = 0
+    while True:
+        data = gql(query, {"login": login, "cursor": cursor}, "repos_stars")
+        repositories = data["user"]["repositories"]
+        repo_total = int(repositories["totalCount"])
+        for edge in repositories["edges"]:
+            stars += int(edge["node"]["stargazers"]["totalCount"])
+        if not repositories["pageInfo"]["hasNextPage"]:
+            return repo_total, stars
+        cursor = repositories["pageInfo"]["endCursor"]
+
+
+class RepoInfo(NamedTuple):
+    full: str
+    is_archived: bool
+    is_empty: bool
+    is_fork: bool
+    pushed_at: str
+    oid: str  # default-branch tip, "-" for repos without one
+    total: int  # commit totalCount on the default branch
+
+
+# Shared by the sync listing and the heavy scan's page-wise pipeline.
+_REPO_LIST_QUERY = """
+query($login: String!, $cursor: String) {
+    user(login: $login) {
+        repositories(first: 100, after: $cursor,
+                     ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]) {
+            edges {
+                node {
+                    nameWithOwner isArchived isEmpty isFork pushedAt
+                    defaultBranchRef {
+                        target {
+                            oid
+                            ... on Commit { history(first: 0) { totalCount } }
+                        }
+                    }
+                }
+            }
+            pageInfo { hasNextPage endCursor }
+        }
+    }
+}"""
+
+
+def _repo_info(node):
+    ref = node["defaultBranchRef"]
+    return RepoInfo(
+        node["nameWithOwner"],
+        node["isArchived"],
+        node["isEmpty"],
+        node["isFork"],
+        node["pushedAt"],
+        ref["target"]["oid"] if ref else "-",
+        int(ref["target"]["history"]["totalCount"]) if ref else 0,
+    )
+
+
+def collect_repo_full_names(login):
+    """RepoInfo for every repo the user can have commits in.
+
+    The listing query also carries the flags and the default-branch tip
+    oid, so scan filtering and cache decisions need no extra requests.
+    """
+    cursor = None
+    infos = []
+    while True:
+        data = gql(_REPO_LIST_QUERY, {"login": login, "cursor": cursor}, "repo_list")
+        repositories = data["user"]["repositories"]
+        infos.extend(_repo_info(edge["node"]) for edge in repositories["edges"])
+        if not repositories["pageInfo"]["hasNextPage"]:
+            return infos
+        cursor = repositories["pageInfo"]["endCursor"]
+
+
+# Repos per aliased GraphQL document. 20 aliases x history(first: 100)
+# keeps each document inside GitHub's query-complexity budget while
+# cutting round trips ~20x.
+HISTORY_BATCH_SIZE = 20
+
+
+def _history_batch_query(active):
+    """One document advancing the history cursor of every repo in `active`.
+
+    The author filter runs server-side, so only the user's own commits
+    are paged and the per-commit author lookup disappears from the
+    response.
+    """
+    decls = ", ".join(f"$c{i}: String" for i, _, _, _ in active)
+    decls = f"$userId: ID, {decls}"
+    fields = "\n".join(
+        f'    r{i}: repository(owner: "{owner}", name: "{name}") {{'
+        " defaultBranchRef { target { ... on Commit {"
+        f" history(first: 100, after: $c{i}, author: {{id: $userId}}) {{"
+        " edges { node { additions deletions } }"
+        " pageInfo { hasNextPage endCursor } } } } } }"
+        for i, owner, name, _ in active
+    )
+    return (
+        f"query({decls}) {{\n"
+        + fields
+        + "\n    rateLimit { cost remaining resetAt }\n}"
+    )
+
+
+async def gql_async(session, sem, query, variables, tag):
+    """Async counterpart of gql, bounded by the shared semaphore."""
+    async with sem:
+        if session is None:
+            return await asyncio.to_thread(gql, query, variables, tag)
+        for attempt in range(MAX_RETRIES):
+            await RATE_LIMITER.wait_async()
+            async with session.post(
+                GRAPHQL_URL, json={"query": query, "variables": variables}
+            ) as r:
+                RATE_LIMITER.note_response(r.status, r.headers)
+                if r.status == 200:
+                    data = _loads(await r.read())
+                    if "errors" not in data:
+                        RATE_LIMITER.note_graphql(data["data"].get("rateLimit"))
+                        return data["data"]
+            await asyncio.sleep(RETRY_BACKOFF ** attempt)
+        raise RuntimeError(f"{tag}: request failed after {MAX_RETRIES} attempts")
+
+
+async def scan_repo_histories_batched(session, sem, entries, user_id):
+    """Walk default-branch history for every (idx, owner, name) in entries.
+
+    Each round trip advances up to HISTORY_BATCH_SIZE repos by one page
+    via aliases; repos whose history is exhausted drop out of the next
+    document. The server already filters to commits authored by user_id,
+    so every returned edge counts. Returns
+    {idx: (my_commits, additions, deletions)}.
+    """
+    results = {i: [0, 0, 0] for i, _, _ in entries}
+
+    async def run(batch):
+        active = [(i, owner, name, None) for i, owner, name in batch]
+        while active:
+            variables = {f"c{i}": cursor for i, _, _, cursor in active}
+            variables["userId"] = user_id
+            data = await gql_async(
+                session, sem, _history_batch_query(active), variables, "loc_repo_scan"
+            )
+            next_active = []
+            for i, owner, name, _ in active:
+                ref = data[f"r{i}"]["defaultBranchRef"]
+                if ref is None:
+                    continue
+                history = ref["target"]["history"]
+                acc = results[i]
+                for edge in history["edges"]:
+                    node = edge["node"]
+                    acc[0] += 1
+                    acc[1] += int(node["additions"])
+                    acc[2] += int(node["deletions"])
+                if history["pageInfo"]["hasNextPage"]:
+                    next_active.append(
+                        (i, owner, name, history["pageInfo"]["endCursor"])
+                    )
+            active = next_active
+
+    await asyncio.gather(
+        *(
+            run(entries[k:k + HISTORY_BATCH_SIZE])
+            for k in range(0, len(entries), HISTORY_BATCH_SIZE)
+        )
+    )
+    return {i: tuple(acc) for i, acc in results.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def repo_hash(full_name):
+    """sha256 hex of a repo name, memoized across cache reads and writes.
+
+    OpenSSL's SHA-NI path makes each digest cheap, but the same names are
+    hashed on every run; the lru_cache makes repeats free.
+    """
+    return hashlib.sha256(full_name.encode()).hexdigest()
+
+
+def cache_path():
+    return CACHE_DIR / (repo_hash(USER_NAME)[:16] + ".txt")
+
+
+def load_repo_cache(fp):
+    """Parse the cache file once into its header gate value and line map.
+
+    Returns (contrib_total_at_gen, {sha256: (oid, total, my, add, del)}).
+    A missing file, an unknown repo, or a line in an older schema is
+    simply a cache miss that gets scanned; there is no skeleton to
+    rebuild and no re-entry dance.
+    """
+    contrib = None
+    cache = {}
+    try:
+        with open(fp) as f:
+            for line in f:
+                if line.startswith("#"):
+                    if line.startswith("# contrib_total_at_gen:"):
+                        contrib = int(line.rpartition(":")[2])
+                    continue
+                try:
+                    h, oid, total, my, add, dele = line.split()
+                except ValueError:
+                    continue
+                cache[h] = (oid, int(total), int(my), int(add), int(dele))
+    except FileNotFoundError:
+        pass
+    return contrib, cache
+
+
+def write_repo_cache(fp, hashes, cache, contrib):
+    """Rewrite the cache file in current repo order with one write."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(fp, "w") as f:
+        f.write(f"# repo cache for {USER_NAME} v2\n")
+        f.write(f"# contrib_total_at_gen: {contrib}\n")
+        f.write(
+            "".join(
+                "{} {} {} {} {} {}\n".format(h, *cache[h]) for h in hashes
+            )
+        )
+
+
+def heavy_stats(user_id):
+    """Commit and LOC totals across every repo, cached between runs."""
+    return asyncio.run(heavy_stats_async(user_id))
+
+
+async def heavy_stats_async(user_id):
+    """Async heavy scan: stale repos rescanned in batched parallel pages.
+
+    The cache keys each repo on its default-branch tip oid; a repo is
+    rescanned only when the tip moved. The oid and the commit totalCount
+    ride along on the listing query, so deciding what is stale costs no
+    requests at all; each page's stale scans are kicked off while the
+    next listing page is still in flight. The scan is I/O bound, so up
+    to HEAVY_CONCURRENCY repos are in flight at once instead of paying
+    one GraphQL round trip after another.
+    """
+    force = os.environ.get("FORCE_CACHE") == "1"
+    fp = cache_path()
+    cached_contrib, cache = (None, {}) if force else load_repo_cache(fp)
+    # Cheapest possible change gate: one contributionsCollection call.
+    # The count moves whenever the user authors a commit anywhere, so a
+    # match means the cached sums can be returned without listing or
+    # scanning a single repo.
+    current_contrib = contrib_total(USER_NAME)
+    if cache and cached_contrib == current_contrib:
+        total_my = total_add = total_del = 0
+        for _, _, my, add, dele in cache.values():
+            total_my += my
+            total_add += add
+            total_del += dele
+        return total_my, total_add, total_del
+    sem = asyncio.Semaphore(HEAVY_CONCURRENCY)
+    if aiohttp is not None:
+        session_ctx = aiohttp.ClientSession(headers=HEADERS)
+    else:
+        session_ctx = contextlib.nullcontext(None)
+    repos = []
+    hashes = []
+    stale = []
+    tasks = []
+    async with session_ctx as session:
+        cursor = None
+        while True:
+            data = await gql_async(
+                session,
+                sem,
+                _REPO_LIST_QUERY,
+                {"login": USER_NAME, "cursor": cursor},
+                "repo_list",
+            )
+            repositories = data["user"]["repositories"]
+            page_stale = []
+            for edge in repositories["edges"]:
+                r = _repo_info(edge["node"])
+                # Empty repos have no history and forks are
+                # overwhelmingly someone else's commits; neither is
+                # worth LOC-scan traffic. Archived repos stay: their
+                # history still counts and the cache keeps them free.
+                if r.is_empty or r.is_fork:
+                    continue
+                i = len(repos)
+                repos.append(r)
+                hashes.append(repo_hash(r.full))
+                # A repo is stale when its tip oid differs from the
+                # cached one; the tip moves on every push, including
+                # force-pushes and rebases that leave totalCount
+                # unchanged, so no edit can slip past the cache.
+                prev = cache.get(hashes[i])
+                if prev is None or prev[0] != r.oid:
+                    stale.append(i)
+                    page_stale.append((i, *r.full.split("/")))
+            # Prefetch: this page's stale scans start immediately and
+            # overlap the fetch of the next listing page, so the run
+            # finishes with the slowest scan rather than after
+            # listing-then-scanning in sequence.
+            if page_stale:
+                tasks.append(
+                    asyncio.ensure_future(
+                        scan_repo_histories_batched(
+                            session, sem, page_stale, user_id
+                        )
+                    )
+                )
+            page_info = repositories["pageInfo"]
+            if not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
+        scans = {}
+        for task in tasks:
+            scans.update(await task)
+
+    for i in stale:
+        cache[hashes[i]] = (repos[i].oid, repos[i].total, *scans[i])
+    if stale or cached_contrib != current_contrib or not fp.exists():
+        write_repo_cache(fp, hashes, cache, current_contrib)
+
+    total_my = total_add = total_del = 0
+    for h in hashes:
+        _, _, my, add, dele = cache[h]
+        total_my += my
+        total_add += add
+        total_del += dele
+    return total_my, total_add, total_del
+
+
+def rel_age(created_at):
+    """Human-readable account age, e.g. '3 years, 2 months, 11 days'.
+
+    Whole months are counted by advancing the birth date month by month
+    (clamping the 29th-31st into shorter months, like relativedelta
+    does), then the leftover is plain day arithmetic. Pulling in
+    dateutil for one subtraction cost more import time than the whole
+    computation.
+    """
+    birth = datetime.datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
+    now = datetime.datetime.utcnow()
+
+    def anchor(month_count):
+        y, m = divmod(birth.month - 1 + month_count, 12)
+        y += birth.year
+        m += 1
+        return birth.replace(
+            year=y, month=m, day=min(birth.day, calendar.monthrange(y, m)[1])
+        )
+
+    total_months = (now.year - birth.year) * 12 + (now.month - birth.month)
+    if anchor(total_months) > now:
+        total_months -= 1
+    years, months = divmod(total_months, 12)
+    days = (now - anchor(total_months)).days
+    return f"{years} years, {months} months, {days} days"
+
+
+# Compiled once at import: these run per SVG, and literal-pattern calls
+# pay a compile-cache lookup on every use.
+_IMPORT_RE = re.compile(r"@import url\(['\"]([^'\"]+)['\"]\);")
+_LOGO_HREF_RE = re.compile(r"href=(\"|')logo\.png\1")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_logo_data_uri():
+    """Logo as a data URI, encoded once per process (None if absent)."""
+    if not LOGO_PATH.exists():
+        return None
+    b64 = base64.b64encode(LOGO_PATH.read_bytes()).decode("ascii")
+    return f"data:image/png;base64,{b64}"
+
+
+def _parse_font_faces(css):
+    """Yield (family, style, weight, woff2_url) per @font-face block.
+
+    Google Fonts CSS is machine-generated and entirely regular, so one
+    split plus literal partition() slices per block replaces the four
+    backtracking regex passes the old parser ran over overlapping text.
+    """
+    for block in css.split("@font-face")[1:]:
+        block = block[: block.find("}")]
+        url = block.partition("url(")[2].partition(")")[0]
+        if not url.endswith(".woff2"):
+            continue
+        family = (
+            block.partition("font-family:")[2].partition(";")[0].strip("'\" ")
+            or "inherit"
+        )
+        style = block.partition("font-style:")[2].partition(";")[0].strip() or "normal"
+        weight = block.partition("font-weight:")[2].partition(";")[0].strip() or "400"
+        yield family, style, weight, url
+
+
+def _conditional_get(url, cache_name, headers=None):
+    """GET with ETag/Last-Modified revalidation against an on-disk copy.
+
+    The validators live in a `.meta.json` sidecar next to the cached
+    bytes; a 304 costs a headers-only round trip and keeps the cached
+    bytes authoritative. Returns (bytes, changed).
+    """
+    headers = dict(headers or {})
+    sidecar = cache_name.with_suffix(".meta.json")
+    cached = None
+    try:
+        cached = cache_name.read_bytes()
+        meta = json.loads(sidecar.read_text())
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    except (FileNotFoundError, ValueError):
+        pass
+    r = requests.get(url, headers=headers)
+    if r.status_code == 304 and cached is not None:
+        return cached, False
+    if r.status_code != 200:
+        # Never let an error body poison the cache; a stale cached copy
+        # beats serving a 404/500 page as CSS or font bytes.
+        if cached is not None:
+            return cached, False
+        raise RuntimeError(f"GET {url} failed with {r.status_code}")
+    cache_name.parent.mkdir(parents=True, exist_ok=True)
+    cache_name.write_bytes(r.content)
+    sidecar.write_text(
+        json.dumps(
+            {
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+            }
+        )
+    )
+    return r.content, r.content != cached
+
+
+@functools.lru_cache(maxsize=8)
+def _get_font_faces_block(import_url):
+    """Inlined @font-face block for one CSS URL.
+
+    Memoized per process (both cards share the same import) and persisted
+    under cache/fonts keyed by the URL hash. The CSS and every woff2 are
+    revalidated with conditional GETs, so an unchanged font costs one 304
+    for the CSS and no woff2 traffic at all.
+    """
+    url_hash = hashlib.sha256(import_url.encode()).hexdigest()
+    css_cache = CACHE_DIR / "fonts" / (url_hash + ".css")
+    faces_cache = CACHE_DIR / "fonts" / (url_hash + ".faces.css")
+    css_bytes, css_changed = _conditional_get(
+        import_url, css_cache, headers={"User-Agent": "Mozilla/5.0"}
+    )
+    if not css_changed:
+        try:
+            return faces_cache.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+    faces = []
+    for family, style, weight, woff_url in _parse_font_faces(
+        css_bytes.decode("utf-8")
+    ):
+        cache_name = CACHE_DIR / "fonts" / (
+            hashlib.sha256(woff_url.encode()).hexdigest() + ".woff2"
+        )
+        woff, _ = _conditional_get(woff_url, cache_name)
+        b64 = base64.b64encode(woff).decode("ascii")
+        faces.append(
+            "@font-face { font-family: '%s'; font-style: %s; font-weight: %s; "
+            "src: url(data:font/woff2;base64,%s) format('woff2'); }"
+            % (family, style, weight, b64)
+        )
+    block = "\n".join(faces)
+    faces_cache.parent.mkdir(parents=True, exist_ok=True)
+    faces_cache.write_text(block, encoding="utf-8")
+    return block
+
+
+def embed_font_if_requested(svg_text):
+    """Inline the Google Fonts faces referenced by an @import, if any."""
+    m = _IMPORT_RE.search(svg_text)
+    if not m:
+        return svg_text
+    return svg_text.replace(m.group(0), _get_font_faces_block(m.group(1)))
+
+
+def embed_logo(svg_text):
+    """Swap a relative logo.png href for a base64 data URI."""
+    data_uri = _get_logo_data_uri()
+    if data_uri is None:
+        return svg_text
+    return _LOGO_HREF_RE.sub(f'href="{data_uri}"', svg_text)
+
+
+def _stats_values(stats):
+    """id -> rendered text for every value tspan in the cards."""
+    return {
+        "age_data": stats["age"],
+        "repo_data": str(stats["repos"]),
+        "contrib_data": str(stats["contributed"]),
+        "commit_data": f"{stats['commits']:,}",
+        "star_data": f"{stats['stars']:,}",
+        "follower_data": f"{stats['followers']:,}",
+        "loc_data": f"{stats['loc_net']:,}",
+        "loc_add_data": f"{stats['loc_add']:,}",
+        "loc_del_data": f"{stats['loc_del']:,}",
+    }
+
+
+# Marker comment written by the structural pass; its presence means the
+# tspan layout below matches what build_stats_container would produce.
+LAYOUT_MARKER = "stats_layout_v1"
+
+_TSPAN_RE = re.compile(r'(<tspan[^>]*\bid="([^"]+)"[^>]*>)([^<]*)(</tspan>)')
+
+
+def _patch_tspans(txt, values):
+    """Rewrite value tspan texts in place without parsing the SVG.
+
+    Only safe while the geometry is unchanged, so this refuses (returns
+    ok=False) when an id is missing or a new value has a different
+    length than the old text — tspan x offsets are derived from text
+    widths, and those cases need the structural lxml pass.
+    """
+    patched = {}
+
+    def sub(m):
+        sid = m.group(2)
+        if sid in values:
+            patched[sid] = len(m.group(3)) == len(values[sid])
+            return m.group(1) + values[sid] + m.group(4)
+        return m.group(0)
+
+    new_txt = _TSPAN_RE.sub(sub, txt)
+    ok = len(patched) == len(values) and all(patched.values())
+    return new_txt, ok
+
+
+def _label(text):
+    """Static segment: its pixel width never changes, so bake it in."""
+    return (text, None, len(text) * CHAR_WIDTH_PX)
+
+
+def _value(id_attr):
+    """Value segment: text comes from `values` at render time."""
+    return (None, id_attr, 0.0)
+
+
+# The card layout is fixed; only the value texts change between renders.
+# Label widths are precomputed here so the per-render arithmetic is one
+# len() per value segment.
+_LINE_DEFS = (
+    (_label("Uptime: "), _value("age_data")),
+    (
+        _label("Repos: "),
+        _value("repo_data"),
+        _label(" | Contributed: "),
+        _value("contrib_data"),
+    ),
+    (_label("Commits: "), _value("commit_data")),
+    (_label("Stars: "), _value("star_data")),
+    (_label("Followers: "), _value("follower_data")),
+    (
+        _label("Lines of Code: "),
+        _value("loc_data"),
+        _label(" ("),
+        _value("loc_add_data"),
+        _label("++, "),
+        _value("loc_del_data"),
+        _label("--)"),
+    ),
+)
+
+
+def build_stats_container(root, values):
+    """Rebuild the <g id="stats_container"> block from the rendered values."""
+    container = root.find(f".//{{{SVG_NS}}}g[@id='stats_container']")
+    for child in list(container):
+        container.remove(child)
+    container.append(etree.Comment(LAYOUT_MARKER))
+    y = 0
+    for segments in _LINE_DEFS:
+        text = etree.SubElement(container, f"{{{SVG_NS}}}text", {"y": str(y)})
+        cursor_x = 0.0
+        for label, id_attr, width in segments:
+            if id_attr:
+                label = values[id_attr]
+                width = len(label) * CHAR_WIDTH_PX
+                attrs = {"x": f"{cursor_x:g}", "class": "value", "id": id_attr}
+            else:
+                attrs = {"x": f"{cursor_x:g}", "class": "key"}
+            tspan = etree.SubElement(text, f"{{{SVG_NS}}}tspan", attrs)
+            tspan.text = label
+            cursor_x += width
+        y += LINE_HEIGHT_PX
+
+
+def _write_if_changed(svg_file, new_bytes, old_bytes):
+    """Write only when the bytes differ, so mtime-only churn never hits git."""
+    if new_bytes != old_bytes:
+        svg_file.write_bytes(new_bytes)
+
+
+def update_svgs(stats):
+    # Most scheduled runs change nothing (no commit, no new follower);
+    # a marker with the last rendered stats hash turns those runs into
+    # one json.dumps + sha256 instead of two parse/serialize cycles.
+    stats_hash = hashlib.sha256(
+        json.dumps(stats, sort_keys=True).encode()
+    ).hexdigest()
+    marker = CACHE_DIR / ".last_stats.sha256"
+    try:
+        if marker.read_text() == stats_hash:
+            return
+    except FileNotFoundError:
+        pass
+    values = _stats_values(stats)
+    # Warm the shared logo cache before the pool; the font block is
+    # keyed on the @import URL inside each card, so its lru_cache plus
+    # the on-disk conditional cache bound a first-run race to one extra
+    # 304 at worst.
+    _get_logo_data_uri()
+    # The two cards are independent, and lxml's parse/serialize and the
+    # file I/O all release the GIL, so both updates genuinely overlap.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        list(ex.map(lambda svg_file: _update_one(svg_file, values), SVG_FILES))
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    marker.write_text(stats_hash)
+
+
+def _update_one(svg_file, values):
+    old = svg_file.read_bytes()
+    txt = old.decode("utf-8")
+    txt = embed_font_if_requested(txt)
+    txt = embed_logo(txt)
+    # Hot path: the layout already matches, so refresh the value texts
+    # with one regex pass instead of a full parse/serialize.
+    if LAYOUT_MARKER in txt:
+        new_txt, ok = _patch_tspans(txt, values)
+        if ok:
+            _write_if_changed(svg_file, new_txt.encode("utf-8"), old)
+            return
+    root = etree.fromstring(txt.encode("utf-8"))
+    build_stats_container(root, values)
+    # This path only runs when the layout marker is absent or a value
+    # changed length, so the output always differs from `old` and there
+    # is nothing to compare: let libxml2 stream straight to the file
+    # instead of materializing a tostring() copy first.
+    etree.ElementTree(root).write(
+        str(svg_file), encoding="utf-8", xml_declaration=True
+    )
+
+
+def main():
+    user_id, created_at = user_getter(USER_NAME)
+    age = rel_age(created_at)
+    followers = follower_getter(USER_NAME)
+    repos, stars = stars_and_repos(USER_NAME)
+    repo_infos = collect_repo_full_names(USER_NAME)
+    owned_prefix = f"{USER_NAME.lower()}/"
+    contributed = sum(
+        1 for r in repo_infos if not r.full.lower().startswith(owned_prefix)
+    )
+    if os.environ.get("DO_HEAVY") == "1":
+        commits, loc_add, loc_del = heavy_stats(user_id)
+    else:
+        commits = loc_add = loc_del = 0
+    stats = {
+        "age": age,
+        "repos": repos,
+        "contributed": contributed,
+        "commits": commits,
+        "stars": stars,
+        "followers": followers,
+        "loc_add": loc_add,
+        "loc_del": loc_del,
+        "loc_net": loc_add - loc_del,
+    }
+    update_svgs(stats)
+    print(f"updated {len(SVG_FILES)} SVGs for {USER_NAME}")
+
+
+if __name__ == "__main__":
+    main()